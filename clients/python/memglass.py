@@ -25,15 +25,79 @@ Example usage:
             print(f"Counter: {counter['value']}")
 """
 
+import asyncio
+import gzip
+import http.client
 import json
+import random
+import sys
+import threading
 import time
+import zlib
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Optional, Union
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Decode JSON straight from the response bytes. orjson's JSONDecodeError
+# subclasses json.JSONDecodeError, so callers only need to catch the latter.
+if orjson is not None:
+    _loads = orjson.loads
+else:
+    _loads = json.loads
+
+# Only advertise encodings that can be decoded here
+_ACCEPT_ENCODING = "gzip, zstd" if zstandard is not None else "gzip"
+
+_DECOMPRESS_ERRORS: Tuple[type, ...] = (zlib.error, EOFError, getattr(gzip, "BadGzipFile", zlib.error))
+if zstandard is not None:
+    _DECOMPRESS_ERRORS += (zstandard.ZstdError,)
+
+# Parsed snapshots hold many small instances; slots drop the per-instance
+# __dict__ where supported (dataclass slots=True needs Python 3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Upper bound for the retry delay while the server is unreachable
+_MAX_RETRY_DELAY = 5.0
+
+
+def _next_delay(delay: float, base: float) -> float:
+    """Double a retry delay, capped at _MAX_RETRY_DELAY (or base if larger)."""
+    return min(delay * 2, max(_MAX_RETRY_DELAY, base))
+
+
+def _jitter(delay: float) -> float:
+    """Add up to 10% random jitter so many clients don't retry in lockstep."""
+    return delay + random.random() * delay * 0.1
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+@dataclass(**_SLOTS)
 class FieldValue:
     """A field value with metadata."""
     name: str
@@ -53,7 +117,7 @@ class FieldValue:
         return self.atomicity == "locked"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TypeInfo:
     """Type metadata."""
     name: str
@@ -62,70 +126,104 @@ class TypeInfo:
     field_count: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ObjectInfo:
-    """An observed object with its current field values."""
+    """
+    An observed object with its current field values.
+
+    Values are kept in a plain dict keyed by field name; atomicity is kept
+    separately and only for fields that are not "none". FieldValue objects
+    are built on demand by get_field() and fields.
+    """
     label: str
     type_name: str
     type_id: int
-    fields: List[FieldValue] = field(default_factory=list)
+    _values: Dict[str, Any] = field(default_factory=dict)
+    _atomicity: Dict[str, str] = field(default_factory=dict)
 
     def __getitem__(self, field_name: str) -> Any:
         """Get field value by name. Supports dot notation for nested fields."""
-        for f in self.fields:
-            if f.name == field_name:
-                return f.value
-        raise KeyError(f"Field '{field_name}' not found in object '{self.label}'")
+        try:
+            return self._values[field_name]
+        except KeyError:
+            raise KeyError(f"Field '{field_name}' not found in object '{self.label}'") from None
 
     def get(self, field_name: str, default: Any = None) -> Any:
         """Get field value with default."""
-        try:
-            return self[field_name]
-        except KeyError:
-            return default
+        return self._values.get(field_name, default)
 
     def get_field(self, field_name: str) -> Optional[FieldValue]:
         """Get full field info including atomicity."""
-        for f in self.fields:
-            if f.name == field_name:
-                return f
-        return None
+        if field_name not in self._values:
+            return None
+        return FieldValue(
+            name=field_name,
+            value=self._values[field_name],
+            atomicity=self._atomicity.get(field_name, "none")
+        )
+
+    @property
+    def fields(self) -> List[FieldValue]:
+        """Get all fields with metadata, in server order."""
+        atomicity = self._atomicity
+        return [FieldValue(name, value, atomicity.get(name, "none"))
+                for name, value in self._values.items()]
 
     @property
     def field_names(self) -> List[str]:
         """Get all field names."""
-        return [f.name for f in self.fields]
+        return list(self._values)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to a plain dictionary of field values."""
-        return {f.name: f.value for f in self.fields}
+        return dict(self._values)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Snapshot:
-    """A point-in-time snapshot of a memglass session."""
+    """
+    A point-in-time snapshot of a memglass session.
+
+    Object and type lookups use indices built on first access. If objects
+    or types is modified afterwards, call _clear_indices() to rebuild them.
+    """
     pid: int
     sequence: int
     types: List[TypeInfo] = field(default_factory=list)
     objects: List[ObjectInfo] = field(default_factory=list)
+    _object_index: Optional[Dict[str, ObjectInfo]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _type_index: Optional[Dict[str, TypeInfo]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _by_type: Optional[Dict[str, List[ObjectInfo]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def _clear_indices(self) -> None:
+        self._object_index = None
+        self._type_index = None
+        self._by_type = None
 
     def get_object(self, label: str) -> Optional[ObjectInfo]:
         """Find an object by label."""
-        for obj in self.objects:
-            if obj.label == label:
-                return obj
-        return None
+        if self._object_index is None:
+            # Reversed so the first object wins on duplicate labels
+            self._object_index = {obj.label: obj for obj in reversed(self.objects)}
+        return self._object_index.get(label)
 
     def get_objects_by_type(self, type_name: str) -> List[ObjectInfo]:
         """Get all objects of a given type."""
-        return [obj for obj in self.objects if obj.type_name == type_name]
+        if self._by_type is None:
+            by_type: Dict[str, List[ObjectInfo]] = {}
+            for obj in self.objects:
+                by_type.setdefault(obj.type_name, []).append(obj)
+            self._by_type = by_type
+        return list(self._by_type.get(type_name, ()))
 
     def get_type(self, name: str) -> Optional[TypeInfo]:
         """Find type info by name."""
-        for t in self.types:
-            if t.name == name:
-                return t
-        return None
+        if self._type_index is None:
+            self._type_index = {t.name: t for t in reversed(self.types)}
+        return self._type_index.get(name)
 
     @property
     def object_labels(self) -> List[str]:
@@ -138,6 +236,115 @@ class Snapshot:
         return [t.name for t in self.types]
 
 
+def _parse_snapshot(data: Dict) -> Snapshot:
+    """
+    Parse JSON response into Snapshot.
+
+    Field names, type names and atomicities repeat across every object of a
+    type, so they are interned to share one string per distinct value.
+    """
+    intern = sys.intern
+    types = [
+        TypeInfo(
+            name=intern(t["name"]),
+            type_id=t["type_id"],
+            size=t["size"],
+            field_count=t["field_count"]
+        )
+        for t in data.get("types", [])
+    ]
+
+    objects = []
+    for obj in data.get("objects", []):
+        values = {}
+        atomicity = {}
+        for f in obj.get("fields", []):
+            name = intern(f["name"])
+            values[name] = f["value"]
+            a = f.get("atomicity", "none")
+            if a != "none":
+                atomicity[name] = intern(a)
+        objects.append(ObjectInfo(
+            label=obj["label"],
+            type_name=intern(obj["type_name"]),
+            type_id=obj["type_id"],
+            _values=values,
+            _atomicity=atomicity
+        ))
+
+    return Snapshot(
+        pid=data.get("pid", 0),
+        sequence=data.get("sequence", 0),
+        types=types,
+        objects=objects
+    )
+
+
+def _parse_snapshot_stream(source) -> Snapshot:
+    """
+    Parse a JSON snapshot incrementally from a file-like object.
+
+    Builds TypeInfo/ObjectInfo directly from ijson events, so
+    only one type or field dict exists at a time instead of the whole
+    decoded document. Repeated names are interned as in _parse_snapshot().
+    """
+    intern = sys.intern
+    pid = 0
+    sequence = 0
+    types: List[TypeInfo] = []
+    objects: List[ObjectInfo] = []
+    obj: Dict[str, Any] = {}
+    values: Dict[str, Any] = {}
+    atomicity: Dict[str, str] = {}
+    builder = None
+    item_prefix = ""
+
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event == "end_map":
+                item = builder.value
+                builder = None
+                if item_prefix == "types.item":
+                    types.append(TypeInfo(
+                        name=intern(item["name"]),
+                        type_id=item["type_id"],
+                        size=item["size"],
+                        field_count=item["field_count"]
+                    ))
+                else:
+                    name = intern(item["name"])
+                    values[name] = item["value"]
+                    a = item.get("atomicity", "none")
+                    if a != "none":
+                        atomicity[name] = intern(a)
+        elif event == "start_map" and prefix in ("types.item", "objects.item.fields.item"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            item_prefix = prefix
+        elif prefix == "objects.item":
+            if event == "start_map":
+                obj = {}
+                values = {}
+                atomicity = {}
+            elif event == "end_map":
+                objects.append(ObjectInfo(
+                    label=obj["label"],
+                    type_name=intern(obj["type_name"]),
+                    type_id=obj["type_id"],
+                    _values=values,
+                    _atomicity=atomicity
+                ))
+        elif prefix.startswith("objects.item.") and event in ("string", "number", "boolean", "null"):
+            obj[prefix[len("objects.item."):]] = value
+        elif prefix == "pid" and event == "number":
+            pid = value
+        elif prefix == "sequence" and event == "number":
+            sequence = value
+
+    return Snapshot(pid=pid, sequence=sequence, types=types, objects=objects)
+
+
 class MemglassError(Exception):
     """Base exception for memglass client errors."""
     pass
@@ -152,21 +359,130 @@ class MemglassClient:
     """
     Client for the memglass Web API.
 
+    Requests are sent over a single persistent (keep-alive) connection,
+    so polling loops such as stream() avoid a TCP handshake per fetch.
+    Call close() or use the client as a context manager to release it.
+    An instance may be shared between threads; requests on the shared
+    connection are serialized.
+
     Args:
         url: Base URL of the memglass web server (e.g., "http://localhost:8080")
         timeout: Request timeout in seconds (default: 5.0)
+        stream_parse: Parse responses incrementally with ijson as they are
+            read, keeping peak memory at one object rather than the whole
+            decoded document. Useful for very large sessions; requires ijson.
 
     Example:
         client = MemglassClient("http://localhost:8080")
         data = client.fetch()
         print(f"PID: {data.pid}, Objects: {len(data.objects)}")
+
+        with MemglassClient("http://localhost:8080") as client:
+            for snapshot in client.stream():
+                ...
     """
 
-    def __init__(self, url: str = "http://localhost:8080", timeout: float = 5.0):
+    def __init__(self, url: str = "http://localhost:8080", timeout: float = 5.0,
+                 stream_parse: bool = False):
+        if stream_parse and ijson is None:
+            raise ImportError("stream_parse requires ijson (pip install ijson)")
         self.url = url.rstrip("/")
         self.timeout = timeout
+        self.stream_parse = stream_parse
         self._last_sequence: Optional[int] = None
 
+        parts = urlsplit(self.url)
+        if parts.scheme == "https":
+            self._conn_class = http.client.HTTPSConnection
+        else:
+            self._conn_class = http.client.HTTPConnection
+        self._host = parts.netloc
+        self._base_path = parts.path
+        self._conn: Optional[http.client.HTTPConnection] = None
+        # Held for a whole request/response cycle on self._conn (reentrant
+        # because error paths call close())
+        self._lock = threading.RLock()
+
+        # Delta polling state (see fetch_delta)
+        self._current: Optional[Snapshot] = None
+        self._delta_epoch: Optional[int] = None
+        self._delta_version = 0
+        self._delta_supported = True
+
+    def _get(self, path: str, headers: Optional[Dict[str, str]] = None,
+             allow: Tuple[int, ...] = ()) -> http.client.HTTPResponse:
+        """
+        Send a GET request on the persistent connection.
+
+        If a reused connection was closed by the server (keep-alive expiry),
+        reconnects and retries once. Error statuses raise MemglassError unless
+        listed in allow. The caller must hold self._lock and read the
+        response body before releasing it.
+        """
+        while True:
+            reused = self._conn is not None
+            if self._conn is None:
+                self._conn = self._conn_class(self._host, timeout=self.timeout)
+            request_headers = {"Accept-Encoding": _ACCEPT_ENCODING}
+            request_headers.update(headers or {})
+            try:
+                self._conn.request("GET", self._base_path + path, headers=request_headers)
+                response = self._conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                self.close()
+                if reused:
+                    continue
+                raise ConnectionError(f"Failed to connect to {self.url}: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                self.close()
+                raise ConnectionError(f"Failed to connect to {self.url}: {e}")
+            except BaseException:
+                # e.g. KeyboardInterrupt mid-response; don't reuse the connection
+                self.close()
+                raise
+
+            if response.status >= 400 and response.status not in allow:
+                # Error responses are rare; drop the connection, not read the body
+                self.close()
+                raise MemglassError(f"HTTP error {response.status}: {response.reason}")
+            return response
+
+    def _read_body(self, response: http.client.HTTPResponse) -> bytes:
+        """Read the whole response body, decompressing it if needed."""
+        try:
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self.close()
+            raise ConnectionError(f"Failed to read response from {self.url}: {e}")
+        except BaseException:
+            # A partially read body leaves the connection unusable
+            self.close()
+            raise
+
+        encoding = response.getheader("Content-Encoding", "identity").lower()
+        try:
+            if encoding == "gzip":
+                return gzip.decompress(body)
+            if encoding == "zstd" and zstandard is not None:
+                return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        except _DECOMPRESS_ERRORS as e:
+            raise MemglassError(f"Invalid compressed response: {e}")
+        if encoding != "identity":
+            raise MemglassError(f"Unsupported Content-Encoding: {encoding}")
+        return body
+
+    def _body_stream(self, response: http.client.HTTPResponse):
+        """File-like view of the response body that decompresses as it reads."""
+        encoding = response.getheader("Content-Encoding", "identity").lower()
+        if encoding == "gzip":
+            return gzip.GzipFile(fileobj=response, mode="rb")
+        if encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().stream_reader(response)
+        if encoding != "identity":
+            self.close()
+            raise MemglassError(f"Unsupported Content-Encoding: {encoding}")
+        return response
+
     def fetch(self) -> Snapshot:
         """
         Fetch current session state.
@@ -178,54 +494,51 @@ class MemglassClient:
             ConnectionError: If the server is unreachable.
             MemglassError: If the response is invalid.
         """
-        try:
-            req = Request(f"{self.url}/api/data")
-            with urlopen(req, timeout=self.timeout) as response:
-                data = json.loads(response.read().decode("utf-8"))
-        except HTTPError as e:
-            raise MemglassError(f"HTTP error {e.code}: {e.reason}")
-        except URLError as e:
-            raise ConnectionError(f"Failed to connect to {self.url}: {e.reason}")
-        except json.JSONDecodeError as e:
-            raise MemglassError(f"Invalid JSON response: {e}")
+        return self._fetch()
 
-        return self._parse_snapshot(data)
-
-    def _parse_snapshot(self, data: Dict) -> Snapshot:
-        """Parse JSON response into Snapshot."""
-        types = [
-            TypeInfo(
-                name=t["name"],
-                type_id=t["type_id"],
-                size=t["size"],
-                field_count=t["field_count"]
-            )
-            for t in data.get("types", [])
-        ]
-
-        objects = []
-        for obj in data.get("objects", []):
-            fields = [
-                FieldValue(
-                    name=f["name"],
-                    value=f["value"],
-                    atomicity=f.get("atomicity", "none")
-                )
-                for f in obj.get("fields", [])
-            ]
-            objects.append(ObjectInfo(
-                label=obj["label"],
-                type_name=obj["type_name"],
-                type_id=obj["type_id"],
-                fields=fields
-            ))
-
-        snapshot = Snapshot(
-            pid=data.get("pid", 0),
-            sequence=data.get("sequence", 0),
-            types=types,
-            objects=objects
-        )
+    def _fetch(self, known: Optional[Tuple[int, int]] = None) -> Optional[Snapshot]:
+        """
+        Fetch current session state, optionally conditional on a change.
+
+        If known is the (pid, sequence) of a snapshot already seen, the
+        server answers 304 with no body while the session structure is
+        unchanged, and None is returned without any JSON parsing.
+        """
+        headers = {}
+        if known is not None:
+            headers["If-Sequence-Changed"] = f"{known[0]}:{known[1]}"
+
+        with self._lock:
+            response = self._get("/api/data", headers)
+            if response.status == 304:
+                response.read()
+                return None
+            if self.stream_parse:
+                # On errors the body may be partially read; the connection is unusable
+                try:
+                    snapshot = _parse_snapshot_stream(self._body_stream(response))
+                    response.read()
+                except ijson.JSONError as e:
+                    self.close()
+                    raise MemglassError(f"Invalid JSON response: {e}")
+                except _DECOMPRESS_ERRORS as e:
+                    self.close()
+                    raise MemglassError(f"Invalid compressed response: {e}")
+                except (OSError, http.client.HTTPException) as e:
+                    self.close()
+                    raise ConnectionError(f"Failed to read response from {self.url}: {e}")
+                except BaseException:
+                    # e.g. KeyError for a malformed object, or KeyboardInterrupt
+                    self.close()
+                    raise
+            else:
+                body = self._read_body(response)
+
+        if not self.stream_parse:
+            try:
+                snapshot = _parse_snapshot(_loads(body))
+            except json.JSONDecodeError as e:
+                raise MemglassError(f"Invalid JSON response: {e}")
 
         self._last_sequence = snapshot.sequence
         return snapshot
@@ -239,6 +552,61 @@ class MemglassClient:
         """
         return self.fetch().get_object(label)
 
+    def fetch_delta(self) -> Snapshot:
+        """
+        Fetch only the field values that changed since the previous call.
+
+        The first call fetches a full snapshot. Later calls request
+        /api/delta and apply the changed values in place, returning the same
+        Snapshot object. A full fetch is done again when the producer or
+        session structure changes, or if the server has no delta endpoint.
+
+        Returns:
+            The current snapshot, updated in place where possible.
+
+        Raises:
+            ConnectionError: If the server is unreachable.
+            MemglassError: If the response is invalid.
+        """
+        # Also keeps the retained snapshot consistent across threads
+        with self._lock:
+            current = self._current
+            if current is None or not self._delta_supported:
+                return self._fetch_delta_base()
+
+            path = f"/api/delta?since={self._delta_version}"
+            if self._delta_epoch is not None:
+                path += f"&epoch={self._delta_epoch}"
+            response = self._get(path, allow=(404,))
+            body = self._read_body(response)
+            if response.status == 404:
+                self._delta_supported = False
+                return self._fetch_delta_base()
+            try:
+                data = _loads(body)
+            except json.JSONDecodeError as e:
+                raise MemglassError(f"Invalid JSON response: {e}")
+
+            if data.get("pid") != current.pid or data.get("sequence") != current.sequence:
+                return self._fetch_delta_base()
+            for change in data.get("changes", []):
+                obj = current.get_object(change["label"])
+                if obj is None:
+                    return self._fetch_delta_base()
+                obj._values.update(change["fields"])
+
+            self._delta_epoch = data.get("epoch")
+            self._delta_version = data.get("version", 0)
+            return current
+
+    def _fetch_delta_base(self) -> Snapshot:
+        """Full fetch that later deltas are applied to."""
+        self._current = self.fetch()
+        # The first delta against a new base resends every value
+        self._delta_epoch = None
+        self._delta_version = 0
+        return self._current
+
     def stream(self, interval: float = 0.5) -> Iterator[Snapshot]:
         """
         Continuously stream snapshots.
@@ -255,12 +623,42 @@ class MemglassClient:
                 if counter:
                     print(counter["value"])
         """
+        delay = interval
         while True:
             try:
                 yield self.fetch()
+                delay = interval
+            except ConnectionError:
+                # Server disconnected, back off and retry
+                time.sleep(_jitter(delay))
+                delay = _next_delay(delay, interval)
+                continue
+            time.sleep(interval)
+
+    def stream_delta(self, interval: float = 0.5) -> Iterator[Snapshot]:
+        """
+        Continuously stream snapshots, transferring only changed values.
+
+        Like stream(), but uses fetch_delta(): the same Snapshot object is
+        updated in place and yielded each cycle (a new one after structural
+        changes), so copy values you need to keep between iterations.
+
+        Args:
+            interval: Time between fetches in seconds (default: 0.5)
+
+        Yields:
+            The current snapshot for each fetch cycle.
+        """
+        delay = interval
+        while True:
+            try:
+                yield self.fetch_delta()
+                delay = interval
             except ConnectionError:
-                # Server disconnected, wait and retry
-                pass
+                # Server disconnected, back off and retry
+                time.sleep(_jitter(delay))
+                delay = _next_delay(delay, interval)
+                continue
             time.sleep(interval)
 
     def stream_changes(self, interval: float = 0.5) -> Iterator[Snapshot]:
@@ -268,7 +666,9 @@ class MemglassClient:
         Stream only when sequence number changes.
 
         More efficient than stream() when you only care about structural
-        changes (new objects, removed objects, type changes).
+        changes (new objects, removed objects, type changes). The server
+        replies 304 with no body while nothing structural has changed, so
+        idle polls skip downloading and parsing the snapshot.
 
         Args:
             interval: Polling interval in seconds
@@ -276,35 +676,46 @@ class MemglassClient:
         Yields:
             Snapshot only when sequence changes.
         """
-        last_seq = None
+        known = None
+        delay = interval
         while True:
             try:
-                snapshot = self.fetch()
-                if snapshot.sequence != last_seq:
-                    last_seq = snapshot.sequence
+                snapshot = self._fetch(known)
+                delay = interval
+                # Servers without conditional fetch support always send a body
+                if snapshot is not None and (snapshot.pid, snapshot.sequence) != known:
+                    known = (snapshot.pid, snapshot.sequence)
                     yield snapshot
             except ConnectionError:
-                pass
+                time.sleep(_jitter(delay))
+                delay = _next_delay(delay, interval)
+                continue
             time.sleep(interval)
 
     def wait_for_producer(self, timeout: float = 30.0, poll_interval: float = 0.5) -> bool:
         """
         Wait for the producer to become available.
 
+        Retries back off exponentially from poll_interval (capped at 5s,
+        with jitter) to avoid hammering a server that is down.
+
         Args:
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between connection attempts
+            poll_interval: Initial time between connection attempts
 
         Returns:
             True if connected, False if timeout reached.
         """
         start = time.time()
+        delay = poll_interval
         while time.time() - start < timeout:
             try:
                 self.fetch()
                 return True
             except ConnectionError:
-                time.sleep(poll_interval)
+                remaining = timeout - (time.time() - start)
+                time.sleep(max(0.0, min(_jitter(delay), remaining)))
+                delay = _next_delay(delay, poll_interval)
         return False
 
     @property
@@ -312,10 +723,185 @@ class MemglassClient:
         """Last seen sequence number, or None if never fetched."""
         return self._last_sequence
 
+    def close(self) -> None:
+        """Close the persistent connection. It is reopened on the next fetch."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "MemglassClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def __repr__(self) -> str:
         return f"MemglassClient({self.url!r})"
 
 
+class AsyncMemglassClient:
+    """
+    asyncio client for the memglass Web API.
+
+    Built on httpx.AsyncClient (optional dependency: pip install httpx).
+    Several producers can be polled concurrently from one event loop, and
+    keep-alive connections are reused across fetches.
+
+    Args:
+        url: Base URL of the memglass web server (e.g., "http://localhost:8080")
+        timeout: Request timeout in seconds (default: 5.0)
+
+    Example:
+        async with AsyncMemglassClient("http://localhost:8080") as client:
+            async for snapshot in client.stream(interval=0.1):
+                print(snapshot.get_object("counter")["value"])
+    """
+
+    def __init__(self, url: str = "http://localhost:8080", timeout: float = 5.0):
+        if httpx is None:
+            raise ImportError("AsyncMemglassClient requires httpx (pip install httpx)")
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self._last_sequence: Optional[int] = None
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=15.0),
+        )
+
+    async def fetch(self) -> Snapshot:
+        """
+        Fetch current session state.
+
+        Returns:
+            Snapshot containing all types and objects with their current values.
+
+        Raises:
+            ConnectionError: If the server is unreachable.
+            MemglassError: If the response is invalid.
+        """
+        return await self._fetch()
+
+    async def _fetch(self, known: Optional[Tuple[int, int]] = None) -> Optional[Snapshot]:
+        """Conditional fetch; see MemglassClient._fetch()."""
+        headers = {}
+        if known is not None:
+            headers["If-Sequence-Changed"] = f"{known[0]}:{known[1]}"
+
+        try:
+            response = await self._client.get("/api/data", headers=headers)
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            data = _loads(response.content)
+        except httpx.HTTPStatusError as e:
+            raise MemglassError(f"HTTP error {e.response.status_code}: {e.response.reason_phrase}")
+        except httpx.TransportError as e:
+            raise ConnectionError(f"Failed to connect to {self.url}: {e}")
+        except json.JSONDecodeError as e:
+            raise MemglassError(f"Invalid JSON response: {e}")
+
+        snapshot = _parse_snapshot(data)
+        self._last_sequence = snapshot.sequence
+        return snapshot
+
+    async def get_object(self, label: str) -> Optional[ObjectInfo]:
+        """Fetch and return a specific object by label."""
+        return (await self.fetch()).get_object(label)
+
+    async def stream(self, interval: float = 0.5) -> AsyncIterator[Snapshot]:
+        """
+        Continuously stream snapshots.
+
+        Args:
+            interval: Time between fetches in seconds (default: 0.5)
+
+        Yields:
+            Snapshot for each fetch cycle.
+        """
+        delay = interval
+        while True:
+            try:
+                yield await self.fetch()
+                delay = interval
+            except ConnectionError:
+                # Server disconnected, back off and retry
+                await asyncio.sleep(_jitter(delay))
+                delay = _next_delay(delay, interval)
+                continue
+            await asyncio.sleep(interval)
+
+    async def stream_changes(self, interval: float = 0.5) -> AsyncIterator[Snapshot]:
+        """
+        Stream only when sequence number changes.
+
+        Args:
+            interval: Polling interval in seconds
+
+        Yields:
+            Snapshot only when sequence changes.
+        """
+        known = None
+        delay = interval
+        while True:
+            try:
+                snapshot = await self._fetch(known)
+                delay = interval
+                if snapshot is not None and (snapshot.pid, snapshot.sequence) != known:
+                    known = (snapshot.pid, snapshot.sequence)
+                    yield snapshot
+            except ConnectionError:
+                await asyncio.sleep(_jitter(delay))
+                delay = _next_delay(delay, interval)
+                continue
+            await asyncio.sleep(interval)
+
+    async def wait_for_producer(self, timeout: float = 30.0, poll_interval: float = 0.5) -> bool:
+        """
+        Wait for the producer to become available.
+
+        Retries back off exponentially from poll_interval (capped at 5s,
+        with jitter) to avoid hammering a server that is down.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll_interval: Initial time between connection attempts
+
+        Returns:
+            True if connected, False if timeout reached.
+        """
+        start = time.time()
+        delay = poll_interval
+        while time.time() - start < timeout:
+            try:
+                await self.fetch()
+                return True
+            except ConnectionError:
+                remaining = timeout - (time.time() - start)
+                await asyncio.sleep(max(0.0, min(_jitter(delay), remaining)))
+                delay = _next_delay(delay, poll_interval)
+        return False
+
+    @property
+    def last_sequence(self) -> Optional[int]:
+        """Last seen sequence number, or None if never fetched."""
+        return self._last_sequence
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncMemglassClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"AsyncMemglassClient({self.url!r})"
+
+
 # Convenience function for one-off fetches
 def fetch(url: str = "http://localhost:8080", timeout: float = 5.0) -> Snapshot:
     """
@@ -328,11 +914,13 @@ def fetch(url: str = "http://localhost:8080", timeout: float = 5.0) -> Snapshot:
     Returns:
         Snapshot of current session state.
     """
-    return MemglassClient(url, timeout).fetch()
+    with MemglassClient(url, timeout) as client:
+        return client.fetch()
 
 
 if __name__ == "__main__":
     import argparse
+    import shutil
     import sys
 
     parser = argparse.ArgumentParser(description="memglass Python client")
@@ -357,29 +945,97 @@ if __name__ == "__main__":
                 "pid": snap.pid,
                 "sequence": snap.sequence,
                 "types": [{"name": t.name, "type_id": t.type_id, "size": t.size, "field_count": t.field_count} for t in snap.types],
-                "objects": [{"label": o.label, "type_name": o.type_name, "fields": [{"name": f.name, "value": f.value, "atomicity": f.atomicity} for f in o.fields]} for o in snap.objects]
+                "objects": [{"label": o.label, "type_name": o.type_name, "fields": [{"name": name, "value": value, "atomicity": o._atomicity.get(name, "none")} for name, value in o._values.items()]} for o in snap.objects]
             }
-            print(json.dumps(output, indent=2))
+            print(_dumps_indented(output))
         else:
-            print(f"PID: {snap.pid}  Sequence: {snap.sequence}  Objects: {len(snap.objects)}")
-            print("-" * 60)
-
-            for obj in snap.objects:
-                if args.object_label and obj.label != args.object_label:
-                    continue
-
-                print(f"{obj.label} ({obj.type_name})")
-                for f in obj.fields:
-                    atomicity = f" [{f.atomicity}]" if f.atomicity != "none" else ""
-                    print(f"  {f.name:30} = {f.value}{atomicity}")
-                print()
+            lines, _ = render_lines(snap)
+            print("\n".join(lines))
+
+    def shown_objects(snap: Snapshot) -> List[ObjectInfo]:
+        return [obj for obj in snap.objects
+                if not args.object_label or obj.label == args.object_label]
+
+    def format_value(obj: ObjectInfo, name: str) -> str:
+        atomicity = obj._atomicity.get(name)
+        suffix = f" [{atomicity}]" if atomicity else ""
+        return f"{obj._values[name]}{suffix}"
+
+    def render_lines(snap: Snapshot):
+        """Text lines for a snapshot and the (row, column) of each field value."""
+        lines = [f"PID: {snap.pid}  Sequence: {snap.sequence}  Objects: {len(snap.objects)}",
+                 "-" * 60]
+        positions = {}
+        for obj in shown_objects(snap):
+            lines.append(f"{obj.label} ({obj.type_name})")
+            for name in obj._values:
+                prefix = f"  {name:30} = "
+                # 1-based terminal coordinates
+                positions[(obj.label, name)] = (len(lines) + 1, len(prefix) + 1)
+                lines.append(prefix + format_value(obj, name))
+            lines.append("")
+        return lines, positions
+
+    def draw_full(snap: Snapshot):
+        """Clear and redraw the screen. Returns the state for update_in_place()."""
+        lines, positions = render_lines(snap)
+        sys.stdout.write("\033[2J\033[H" + "\n".join(lines) + "\n")
+        sys.stdout.flush()
+        size = shutil.get_terminal_size()
+        if len(lines) >= size.lines or any(len(line) > size.columns for line in lines):
+            # Rows that scrolled off screen can't be addressed, and wrapped
+            # lines shift every row below them; repaint every time
+            return None
+        return {
+            "key": (snap.pid, snap.sequence),
+            "size": size,
+            "positions": positions,
+            "values": {obj.label: dict(obj._values) for obj in shown_objects(snap)},
+            "end_row": len(lines) + 1,
+        }
+
+    def update_in_place(snap: Snapshot, screen) -> bool:
+        """Rewrite only changed values on screen. False if a full repaint is needed."""
+        if (snap.pid, snap.sequence) != screen["key"]:
+            return False
+        if shutil.get_terminal_size() != screen["size"]:
+            return False
+        width = screen["size"].columns
+        objects = shown_objects(snap)
+        if len(objects) != len(screen["values"]):
+            return False
+
+        out = []
+        for obj in objects:
+            previous = screen["values"].get(obj.label)
+            if previous is None or previous.keys() != obj._values.keys():
+                return False
+            for name, value in obj._values.items():
+                if previous[name] != value:
+                    previous[name] = value
+                    row, col = screen["positions"][(obj.label, name)]
+                    text = format_value(obj, name)
+                    if col - 1 + len(text) > width:
+                        # The line would wrap and shift the rows below it
+                        return False
+                    out.append(f"\033[{row};{col}H{text}\033[K")
+
+        if out:
+            out.append(f"\033[{screen['end_row']};1H")
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+        return True
 
     try:
         if args.watch:
             print(f"Watching {args.url} (Ctrl+C to stop)...\n")
+            screen = None
             for snap in client.stream(interval=args.interval):
-                print("\033[2J\033[H", end="")  # Clear screen
-                print_snapshot(snap)
+                if args.json:
+                    print("\033[2J\033[H", end="")  # Clear screen
+                    print_snapshot(snap)
+                elif screen is None or not update_in_place(snap, screen):
+                    screen = draw_full(snap)
         else:
             snap = client.fetch()
             print_snapshot(snap)
@@ -24,6 +24,7 @@
 #include <httplib.h>
 #include <atomic>
 #include <cmath>
+#include <mutex>
 #endif
 
 static volatile bool g_running = true;
@@ -957,23 +958,61 @@ const char* WEB_UI_HTML = R"html(<!DOCTYPE html>
 class WebServer {
 public:
     WebServer(memglass::Observer& obs, int port)
-        : obs_(obs), port_(port), running_(false) {}
+        : obs_(obs), port_(port), running_(false),
+          epoch_(static_cast<uint64_t>(
+              std::chrono::system_clock::now().time_since_epoch().count())) {}
 
     void run() {
         httplib::Server svr;
 
+        // Let polling clients reuse a keep-alive connection for a few fetches.
+        // httplib holds a thread-pool worker (~max(8, cores-1)) for as long
+        // as a connection stays open, and a client polling every 0.5s never
+        // reaches the idle timeout, so the request cap decides how long it
+        // keeps its worker. At 10 requests that is ~5s, after which the
+        // client reconnects and queued connections (e.g. the web UI) get a
+        // turn. Higher caps save handshakes but let a few pollers starve
+        // everyone else for proportionally longer.
+        svr.set_keep_alive_max_count(10);
+        svr.set_keep_alive_timeout(2);
+
         // Serve the main UI
         svr.Get("/", [](const httplib::Request&, httplib::Response& res) {
             res.set_content(WEB_UI_HTML, "text/html");
         });
 
         // API endpoint: get all data
-        svr.Get("/api/data", [this](const httplib::Request&, httplib::Response& res) {
+        svr.Get("/api/data", [this](const httplib::Request& req, httplib::Response& res) {
             obs_.refresh();
+
+            // Conditional fetch: clients that already hold this pid/sequence
+            // get 304 with no body when the session structure is unchanged.
+            // (Not an ETag: field values change without bumping the sequence.)
+            std::string version = std::to_string(obs_.producer_pid()) + ":" +
+                                  std::to_string(obs_.sequence());
+            res.set_header("X-Memglass-Sequence", version);
+            if (req.get_header_value("If-Sequence-Changed") == version) {
+                res.status = 304;
+                return;
+            }
+
             std::string json = build_json();
             res.set_content(json, "application/json");
         });
 
+        // API endpoint: field values changed since a client's last delta.
+        // The since cursor is only valid for the epoch (server instance) that
+        // issued it; otherwise every value is sent.
+        svr.Get("/api/delta", [this](const httplib::Request& req, httplib::Response& res) {
+            obs_.refresh();
+            uint64_t since = 0;
+            if (req.has_param("since") &&
+                req.get_param_value("epoch") == std::to_string(epoch_)) {
+                since = std::strtoull(req.get_param_value("since").c_str(), nullptr, 10);
+            }
+            res.set_content(build_delta_json(since), "application/json");
+        });
+
         running_ = true;
         std::cerr << "Web server running at http://localhost:" << port_ << "\n";
         std::cerr << "Press Ctrl+C to stop.\n";
@@ -1047,9 +1086,97 @@ private:
         return ss.str();
     }
 
+    std::string build_delta_json(uint64_t since) {
+        std::lock_guard<std::mutex> lock(delta_mutex_);
+
+        uint64_t pid = obs_.producer_pid();
+        uint64_t sequence = obs_.sequence();
+        if (pid != tracked_pid_ || sequence != tracked_sequence_) {
+            // Structure changed; clients refetch /api/data, so start over
+            tracked_.clear();
+            tracked_pid_ = pid;
+            tracked_sequence_ = sequence;
+        }
+        if (since > version_) {
+            since = 0;
+        }
+
+        // Record values that differ from the last pass under the next version
+        uint64_t next = version_ + 1;
+        bool any_changed = false;
+
+        std::ostringstream changes;
+        bool first_object = true;
+        const auto& types = obs_.types();
+        auto objects = obs_.objects();
+        for (const auto& obj : objects) {
+            auto view = obs_.get(obj);
+            const memglass::ObservedType* type_info = nullptr;
+            for (const auto& t : types) {
+                if (t.name == obj.type_name) {
+                    type_info = &t;
+                    break;
+                }
+            }
+            if (!type_info || !view) continue;
+
+            auto& tracked_fields = tracked_[obj.label];
+            std::ostringstream fields;
+            bool first_field = true;
+            for (const auto& field : type_info->fields) {
+                auto fv = view[field.name];
+                std::string value = fv ? format_value_json(fv) : "null";
+
+                auto& tracked = tracked_fields[field.name];
+                if (tracked.changed == 0 || tracked.json != value) {
+                    tracked.json = std::move(value);
+                    tracked.changed = next;
+                    any_changed = true;
+                }
+                if (tracked.changed > since) {
+                    if (!first_field) fields << ",";
+                    first_field = false;
+                    fields << "\"" << json_escape(field.name) << "\":" << tracked.json;
+                }
+            }
+
+            if (!first_field) {
+                if (!first_object) changes << ",";
+                first_object = false;
+                changes << "{\"label\":\"" << json_escape(obj.label) << "\""
+                        << ",\"fields\":{" << fields.str() << "}}";
+            }
+        }
+
+        if (any_changed) {
+            version_ = next;
+        }
+
+        std::ostringstream ss;
+        ss << "{\"pid\":" << pid
+           << ",\"sequence\":" << sequence
+           << ",\"epoch\":" << epoch_
+           << ",\"version\":" << version_
+           << ",\"changes\":[" << changes.str() << "]}";
+        return ss.str();
+    }
+
+    // Last value served for a field and the delta version it changed in
+    struct TrackedValue {
+        std::string json;
+        uint64_t changed = 0;
+    };
+
     memglass::Observer& obs_;
     int port_;
     std::atomic<bool> running_;
+
+    std::mutex delta_mutex_;
+    uint64_t epoch_;
+    uint64_t version_ = 0;
+    uint64_t tracked_pid_ = 0;
+    uint64_t tracked_sequence_ = 0;
+    std::map<std::string, std::map<std::string, TrackedValue>> tracked_;
 };
 
 #endif // MEMGLASS_WEB_ENABLED